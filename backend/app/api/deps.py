@@ -6,6 +6,7 @@ import logging
 import json
 import base64
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Annotated, Optional
 
@@ -85,12 +86,59 @@ def decode_jwt_header(token: str) -> dict:
     )
 
 
+# -------------------------------------------------------
+# Verified-claims cache
+# -------------------------------------------------------
+
+# token -> (claims, exp). Bursty reads reuse the same bearer token, so a
+# hit skips the JWK import and signature check; entries are only served
+# while ``exp`` is still in the future.
+_CLAIMS_CACHE: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+CLAIMS_CACHE_SIZE = 8192
+
+
+def _get_cached_claims(token: str) -> Optional[dict]:
+
+    entry = _CLAIMS_CACHE.get(token)
+
+    if entry is None:
+        return None
+
+    claims, exp = entry
+
+    if exp <= time.time():
+        _CLAIMS_CACHE.pop(token, None)
+        return None
+
+    _CLAIMS_CACHE.move_to_end(token)
+    return dict(claims)
+
+
+def _set_cached_claims(token: str, claims: dict) -> None:
+
+    exp = claims.get("exp")
+
+    if not isinstance(exp, (int, float)):
+        return
+
+    _CLAIMS_CACHE[token] = (claims, float(exp))
+    _CLAIMS_CACHE.move_to_end(token)
+
+    if len(_CLAIMS_CACHE) > CLAIMS_CACHE_SIZE:
+        _CLAIMS_CACHE.popitem(last=False)
+
+
 # -------------------------------------------------------
 # JWT verification
 # -------------------------------------------------------
 
 async def verify_supabase_jwt(token: str) -> dict:
 
+    cached = _get_cached_claims(token)
+
+    if cached is not None:
+        return cached
+
     try:
 
         header = decode_jwt_header(token)
@@ -114,7 +162,10 @@ async def verify_supabase_jwt(token: str) -> dict:
         claims = authlib_jwt.decode(token, key)
         claims.validate()
 
-        return dict(claims)
+        payload = dict(claims)
+        _set_cached_claims(token, payload)
+
+        return dict(payload)
 
     except HTTPException:
         raise
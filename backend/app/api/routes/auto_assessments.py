@@ -10,8 +10,8 @@ def register_assessment_routes():
 
     for assessment_type, config in ASSESSMENT_REGISTRY.items():
 
-        specialty = config["specialty"]
-        input_schema = config["input_schema"]
+        specialty = config.specialty
+        input_schema = config.input_schema
 
         # convert ALZHEIMER_DIAGNOSIS_BASIC → diagnosis-basic
         endpoint_path = assessment_type.lower().replace(f"{specialty}_", "").replace("_", "-")
@@ -20,6 +20,7 @@ from app.services.registry import register_assessment
 from app.clinical.utils import (
     fill_defaults,
     preprocess_for_prediction,
+    predict_proba_validated,
     load_model,
     log_usage,
 )
@@ -40,16 +41,17 @@ MODEL_VERSION = "1.0.0"
 
 CLASS_NAMES = ["CN", "MCI", "AD"]
 
+# Must match the model's feature_names_in_ (checked at bind time)
 BASIC_FEATURE_ORDER = [
     "AGE",
     "MMSE",
     "FAQ",
     "PTEDUCAT",
+    "PTGENDER",
+    "APOE4",
     "RAVLT_immediate",
     "MOCA",
     "ADAS13",
-    "PTGENDER",
-    "APOE4",
 ]
 
 NUMERIC_COLUMNS = [
@@ -118,9 +120,10 @@ def predict_cognitive_status_basic(
             numeric_columns=NUMERIC_COLUMNS,
             categorical_columns=CATEGORICAL_COLUMNS,
             scaler=preprocessor,
+            model=model,
         )
 
-        y_proba = model.predict_proba(X_scaled)[0]
+        y_proba = predict_proba_validated(model, X_scaled)[0]
         y_pred_idx = int(np.argmax(y_proba))
 
         predicted_class = CLASS_NAMES[y_pred_idx]
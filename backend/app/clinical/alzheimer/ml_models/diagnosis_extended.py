@@ -22,6 +22,7 @@ from app.schemas.alzheimer.diagnosis_extended import (
 from app.clinical.utils import (
     fill_defaults,
     preprocess_for_prediction,
+    predict_proba_validated,
     load_model,
     log_usage,
 )
@@ -132,10 +133,11 @@ def predict_cognitive_status_extended(
             numeric_columns=NUMERIC_COLUMNS,
             categorical_columns=CATEGORICAL_COLUMNS,
             scaler=preprocessor,
+            model=model,
         )
 
         # Predict
-        y_proba = model.predict_proba(X_scaled)[0]
+        y_proba = predict_proba_validated(model, X_scaled)[0]
         y_pred_idx = int(np.argmax(y_proba))
 
         predicted_class = CLASS_NAMES[y_pred_idx]
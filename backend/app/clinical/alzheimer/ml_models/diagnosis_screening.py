@@ -59,11 +59,6 @@ def _get_model():
 # Prediction Function
 # -----------------------------
 
-@register_assessment(
-    ASSESSMENT_TYPE,
-    specialty="alzheimer",
-    input_schema=AlzheimerDiagnosisInput,
-)
 def predict_cognitive_status(
     input_schema: AlzheimerDiagnosisInput,
 ) -> AlzheimerDiagnosisOutput:
@@ -138,4 +133,17 @@ def predict_cognitive_status(
         )
 
 
+# -----------------------------
+# Self Registration
+# -----------------------------
+
+register_assessment(
+    assessment_type=ASSESSMENT_TYPE,
+    specialty="alzheimer",
+    predict_fn=predict_cognitive_status,
+    input_schema=AlzheimerDiagnosisInput,
+    output_schema=AlzheimerDiagnosisOutput,
+)
+
+
 __all__ = ["predict_cognitive_status"]
\ No newline at end of file
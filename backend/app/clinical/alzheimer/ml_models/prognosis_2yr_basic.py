@@ -1,5 +1,3 @@
-import numpy as np
-
 from app.services.registry import register_assessment
 
 from app.schemas.alzheimer.prognosis_2yr_basic import (
@@ -9,7 +7,9 @@ from app.schemas.alzheimer.prognosis_2yr_basic import (
 
 from app.clinical.utils import (
     fill_defaults,
-    preprocess_for_prediction_dataframe,
+    preprocess_for_prediction,
+    predict_proba_validated,
+    bucket_progression_risk,
     load_model,
     log_usage,
 )
@@ -69,11 +69,6 @@ CATEGORICAL_DEFAULTS = {
 TOP_FEATURES_PLACEHOLDER = ["CDRSB", "ADAS13", "AGE"]
 
 
-@register_assessment(
-    ASSESSMENT_TYPE,
-    specialty="alzheimer",
-    input_schema=AlzheimerPrognosis2yrBasicInput,
-)
 def predict_prognosis_2yr_basic(
     input_schema: AlzheimerPrognosis2yrBasicInput,
 ) -> AlzheimerPrognosis2yrBasicOutput:
@@ -93,7 +88,7 @@ def predict_prognosis_2yr_basic(
             CATEGORICAL_DEFAULTS,
         )
 
-        X_scaled = preprocess_for_prediction_dataframe(
+        X_scaled = preprocess_for_prediction(
             input_data=input_filled,
             numeric_defaults=NUMERIC_DEFAULTS,
             categorical_defaults=CATEGORICAL_DEFAULTS,
@@ -101,24 +96,16 @@ def predict_prognosis_2yr_basic(
             numeric_columns=NUMERIC_COLUMNS,
             categorical_columns=CATEGORICAL_COLUMNS,
             scaler=preprocessor,
+            model=model,
         )
 
-        y_proba = model.predict_proba(X_scaled)[0]
+        # Columns follow CLASS_NAMES: (Stable, Progress)
+        probs = predict_proba_validated(model, X_scaled)
+        risk_levels = bucket_progression_risk(probs[:, 1])
 
-        probabilities = {
-            cls: float(prob)
-            for cls, prob in zip(CLASS_NAMES, y_proba)
-        }
-
-        prob_stable = probabilities["Stable"]
-        prob_progress = probabilities["Progress"]
-
-        if prob_progress < 0.2:
-            risk_level = "low"
-        elif prob_progress < 0.5:
-            risk_level = "moderate"
-        else:
-            risk_level = "high"
+        prob_stable = float(probs[0, 0])
+        prob_progress = float(probs[0, 1])
+        risk_level = str(risk_levels[0])
 
         summary_text = (
             f"The patient has a {risk_level} ({prob_progress*100:.1f}%) "
@@ -160,4 +147,17 @@ def predict_prognosis_2yr_basic(
             model_name=MODEL_NAME,
             model_version=MODEL_VERSION,
             error=str(e),
-        )
\ No newline at end of file
+        )
+
+
+# -----------------------------
+# Self Registration
+# -----------------------------
+
+register_assessment(
+    assessment_type=ASSESSMENT_TYPE,
+    specialty="alzheimer",
+    predict_fn=predict_prognosis_2yr_basic,
+    input_schema=AlzheimerPrognosis2yrBasicInput,
+    output_schema=AlzheimerPrognosis2yrBasicOutput,
+)
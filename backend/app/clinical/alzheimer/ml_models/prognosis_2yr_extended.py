@@ -7,8 +7,6 @@ Predicts probability of progression to AD within 2 years using:
 - CSF biomarkers (ABETA, TAU, PTAU)
 """
 
-import numpy as np
-
 from app.services.registry import register_assessment
 
 from app.schemas.alzheimer.prognosis_2yr_extended import (
@@ -19,6 +17,8 @@ from app.schemas.alzheimer.prognosis_2yr_extended import (
 from app.clinical.utils import (
     fill_defaults,
     preprocess_for_prediction,
+    predict_proba_validated,
+    bucket_progression_risk,
     load_model,
     log_usage,
 )
@@ -84,11 +84,6 @@ CATEGORICAL_DEFAULTS = {
 TOP_FEATURES_PLACEHOLDER = ["CDRSB", "ADAS13", "AGE"]
 
 
-@register_assessment(
-    ASSESSMENT_TYPE,
-    specialty="alzheimer",
-    input_schema=AlzheimerPrognosis2yrExtendedInput,
-)
 def predict_prognosis_2yr_extended(
     input_schema: AlzheimerPrognosis2yrExtendedInput,
 ) -> AlzheimerPrognosis2yrExtendedOutput:
@@ -116,24 +111,16 @@ def predict_prognosis_2yr_extended(
             numeric_columns=NUMERIC_COLUMNS,
             categorical_columns=CATEGORICAL_COLUMNS,
             scaler=preprocessor,
+            model=model,
         )
 
-        y_proba = model.predict_proba(X_scaled)[0]
-
-        probabilities = {
-            cls: float(prob)
-            for cls, prob in zip(CLASS_NAMES, y_proba)
-        }
-
-        prob_stable = probabilities["Stable"]
-        prob_progress = probabilities["Progress"]
+        # Columns follow CLASS_NAMES: (Stable, Progress)
+        probs = predict_proba_validated(model, X_scaled)
+        risk_levels = bucket_progression_risk(probs[:, 1])
 
-        if prob_progress < 0.2:
-            risk_level = "low"
-        elif prob_progress < 0.5:
-            risk_level = "moderate"
-        else:
-            risk_level = "high"
+        prob_stable = float(probs[0, 0])
+        prob_progress = float(probs[0, 1])
+        risk_level = str(risk_levels[0])
 
         summary_text = (
             f"The patient has a {risk_level} ({prob_progress*100:.1f}%) "
@@ -178,4 +165,17 @@ def predict_prognosis_2yr_extended(
         )
 
 
+# -----------------------------
+# Self Registration
+# -----------------------------
+
+register_assessment(
+    assessment_type=ASSESSMENT_TYPE,
+    specialty="alzheimer",
+    predict_fn=predict_prognosis_2yr_extended,
+    input_schema=AlzheimerPrognosis2yrExtendedInput,
+    output_schema=AlzheimerPrognosis2yrExtendedOutput,
+)
+
+
 __all__ = ["predict_prognosis_2yr_extended"]
@@ -122,8 +122,9 @@ def calculate_risk_score(
 # ===============================
 
 register_assessment(
-    name="alzheimer_risk_screener",
+    assessment_type="ALZHEIMER_RISK_SCREENER",
+    specialty="alzheimer",
+    predict_fn=calculate_risk_score,
     input_schema=AlzheimerRiskScreenerInput,
     output_schema=AlzheimerRiskScreenerOutput,
-    runner=calculate_risk_score,
 )
\ No newline at end of file
@@ -10,31 +10,66 @@ Refactored for schema-based consistency and clinical safety.
 """
 from uuid import uuid4
 import math
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+import numpy as np
+import pandas as pd
 from app.services.registry import register_assessment
 
 from app.schemas.cardiology.cardiology import ASCVDRiskInput, ASCVDRiskOutput
 from app.clinical.utils import log_usage
-from app.clinical.cardiology.ascvd_coefficients import _PCE_CONSTANTS
+from app.clinical.cardiology.ascvd_coefficients import PCEParams, _PCE_CONSTANTS, _PCE_MATRIX
+
+
+# ==========================================================
+# Validation bounds (PCE guideline ranges)
+# ==========================================================
+_BOUNDED_FIELDS = ("age", "total_cholesterol", "hdl_cholesterol", "systolic_bp")
+_BOUNDS_LOW = np.array([40, 130, 20, 90], dtype=np.float64)
+_BOUNDS_HIGH = np.array([79, 320, 100, 200], dtype=np.float64)
+_BOUNDS_ERRORS = (
+    "Age must be between 40 and 79.",
+    "Total cholesterol must be between 130 and 320 mg/dL.",
+    "HDL cholesterol must be between 20 and 100 mg/dL.",
+    "Systolic BP must be between 90 and 200 mmHg.",
+)
+
+_GENDERS = frozenset({"male", "female"})
+_RACES = frozenset({"white", "black", "hispanic", "asian", "other"})
 
 
 # ==========================================================
 # Internal helpers
 # ==========================================================
-def _validate_input(data: Dict[str, Any]) -> None:
-    """Validate physiological and demographic ranges per PCE guidelines."""
-    if not (40 <= data["age"] <= 79):
-        raise ValueError("Age must be between 40 and 79.")
-    if data["gender"].lower() not in {"male", "female"}:
+def _out_of_range(vals: np.ndarray) -> np.ndarray:
+    """True where a bounded value is outside its PCE range or not finite."""
+    return (vals < _BOUNDS_LOW) | (vals > _BOUNDS_HIGH) | ~np.isfinite(vals)
+
+
+def _validate_input(data: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Validate physiological and demographic ranges per PCE guidelines.
+
+    Returns the lower-cased (gender, race) pair.
+    """
+    vals = np.array([data[k] for k in _BOUNDED_FIELDS], dtype=np.float64)
+    out_of_range = _out_of_range(vals)
+
+    # Same order as the field-by-field checks: age, gender, race, labs.
+    if out_of_range[0]:
+        raise ValueError(_BOUNDS_ERRORS[0])
+
+    gender = data["gender"].lower()
+    race = data["race"].lower()
+    if gender not in _GENDERS:
         raise ValueError("Gender must be 'male' or 'female'.")
-    if data["race"].lower() not in {"white", "black", "hispanic", "asian", "other"}:
+    if race not in _RACES:
         raise ValueError("Race must be one of: white, black, hispanic, asian, other.")
-    if not (130 <= data["total_cholesterol"] <= 320):
-        raise ValueError("Total cholesterol must be between 130 and 320 mg/dL.")
-    if not (20 <= data["hdl_cholesterol"] <= 100):
-        raise ValueError("HDL cholesterol must be between 20 and 100 mg/dL.")
-    if not (90 <= data["systolic_bp"] <= 200):
-        raise ValueError("Systolic BP must be between 90 and 200 mmHg.")
+
+    if out_of_range.any():
+        raise ValueError(_BOUNDS_ERRORS[int(np.argmax(out_of_range))])
+
+    return gender, race
 
 
 def _compute_terms(data: Dict[str, Any]) -> Dict[str, float]:
@@ -85,10 +120,10 @@ def _build_feature_terms(data: Dict[str, Any], gender: str, race: str) -> Dict[s
     return terms
 
 
-def _compute_risk(S0: float, mean_lp: float, betas: Dict[str, float], terms: Dict[str, float]) -> float:
+def _compute_risk(params: PCEParams, terms: Dict[str, float]) -> float:
     """Compute 10-year ASCVD risk from linear predictor."""
-    lp = sum(betas[k] * terms[k] for k in terms if k in betas)
-    deviation = lp - mean_lp
+    S0 = params.S0
+    deviation = params.lp(terms) - params.mean_lp
 
     # Prevent overflow in exp()
     if deviation > 709:
@@ -127,17 +162,15 @@ def calculate_ascvd(input_data: ASCVDRiskInput) -> ASCVDRiskOutput:
     data: Dict[str, Any] = input_data.dict()
 
     try:
-        _validate_input(data)
-
-        gender = data["gender"].lower()
-        cohort_race = "black" if data["race"].lower() == "black" else "white"
+        gender, race = _validate_input(data)
+        cohort_race = "black" if race == "black" else "white"
 
         params = _PCE_CONSTANTS.get((gender, cohort_race))
         if params is None:
             raise ValueError(f"Unsupported combination: gender={gender}, race={cohort_race}")
 
         terms = _build_feature_terms(data, gender, cohort_race)
-        risk = _compute_risk(params.S0, params.mean_lp, params.betas, terms)
+        risk = _compute_risk(params, terms)
         risk_pct = round(risk * 100, 2)
         category = _categorize_risk(risk_pct)
 
@@ -169,15 +202,85 @@ def calculate_ascvd(input_data: ASCVDRiskInput) -> ASCVDRiskOutput:
             model_version="1.0.0",
         )
 
+# ==========================================================
+# Batch API (cohort scoring)
+# ==========================================================
+def _pce_design_matrix(df: pd.DataFrame) -> np.ndarray:
+    """Build the (N, len(PCE_FEATURES)) design matrix for a cohort."""
+    ln_age = np.log(df["age"].to_numpy(dtype=np.float64))
+    ln_tc = np.log(df["total_cholesterol"].to_numpy(dtype=np.float64))
+    ln_hdl = np.log(df["hdl_cholesterol"].to_numpy(dtype=np.float64))
+    ln_sbp = np.log(df["systolic_bp"].to_numpy(dtype=np.float64))
+    trt = df["on_hypertension_treatment"].to_numpy(dtype=bool)
+    smoker = df["smoker"].to_numpy(dtype=np.float64)
+    diabetes = df["diabetes"].to_numpy(dtype=np.float64)
+
+    ln_sbp_trt = np.where(trt, ln_sbp, 0.0)
+    ln_sbp_untrt = np.where(trt, 0.0, ln_sbp)
+
+    # Column order must match ascvd_coefficients.PCE_FEATURES
+    return np.ascontiguousarray(
+        np.column_stack([
+            ln_age,
+            ln_age * ln_age,
+            ln_tc,
+            ln_age * ln_tc,
+            ln_hdl,
+            ln_age * ln_hdl,
+            ln_sbp_trt,
+            ln_age * ln_sbp_trt,
+            ln_sbp_untrt,
+            ln_age * ln_sbp_untrt,
+            smoker,
+            ln_age * smoker,
+            diabetes,
+        ]),
+        dtype=np.float64,
+    )
+
+
+def predict_ascvd_batch(df: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized 10-year ASCVD risk (0–1) for a cohort DataFrame.
+
+    Expects the ASCVDRiskInput columns. Rows failing PCE range or
+    gender/race validation get NaN instead of raising, so one bad row
+    doesn't abort a screening run.
+    """
+    gender = df["gender"].str.lower().to_numpy()
+    race = df["race"].str.lower().to_numpy()
+    cohort_race = np.where(race == "black", "black", "white")
+
+    vals = df[list(_BOUNDED_FIELDS)].to_numpy(dtype=np.float64)
+    valid = (
+        ~np.any(_out_of_range(vals), axis=1)
+        & np.isin(gender, list(_GENDERS))
+        & np.isin(race, list(_RACES))
+    )
+
+    X = _pce_design_matrix(df)
+    risk = np.full(len(df), np.nan)
+
+    for (group_gender, group_race), (beta, S0, mean_lp) in _PCE_MATRIX.items():
+        mask = valid & (gender == group_gender) & (cohort_race == group_race)
+        if not mask.any():
+            continue
+        deviation = np.clip(X[mask] @ beta - mean_lp, -709.0, 709.0)
+        risk[mask] = 1.0 - S0 ** np.exp(deviation)
+
+    return np.clip(risk, 0.0, 1.0)
+
+
 # ===============================
 # Registry Registration
 # ===============================
 
 register_assessment(
-    name="ascvd_risk",
+    assessment_type="CARDIOLOGY_ASCVD",
+    specialty="cardiology",
+    predict_fn=calculate_ascvd,
     input_schema=ASCVDRiskInput,
     output_schema=ASCVDRiskOutput,
-    runner=calculate_ascvd,
 )
 
-__all__ = ["calculate_ascvd"]
+__all__ = ["calculate_ascvd", "predict_ascvd_batch"]
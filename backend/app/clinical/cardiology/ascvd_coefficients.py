@@ -1,11 +1,30 @@
-from dataclasses import dataclass
-from typing import Dict, Any, Tuple
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Any, Mapping, Tuple
 
-@dataclass
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
 class PCEParams:
     S0: float
     mean_lp: float
     betas: Dict[str, float]
+    _beta_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _beta_vals: array = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen key/value views so the linear predictor is a zip,
+        # not a dict walk.
+        object.__setattr__(self, "_beta_keys", tuple(self.betas))
+        object.__setattr__(self, "_beta_vals", array("d", self.betas.values()))
+
+    def lp(self, terms: Mapping[str, float]) -> float:
+        """Linear predictor; terms this group has no beta for are ignored."""
+        return sum(
+            beta * terms.get(key, 0.0)
+            for key, beta in zip(self._beta_keys, self._beta_vals)
+        )
 
 
 _PCE_CONSTANTS: Dict[Tuple[str, str], PCEParams] = {
@@ -72,3 +91,41 @@ _PCE_CONSTANTS: Dict[Tuple[str, str], PCEParams] = {
         },
     ),
 }
+
+
+# ==========================================================
+# Dense coefficient layout for batch scoring
+# ==========================================================
+# Canonical feature order shared by every (sex, race) group. Betas that
+# a group doesn't use are zero-padded so one (N, F) design matrix works
+# for all groups.
+PCE_FEATURES: Tuple[str, ...] = (
+    "ln_age",
+    "ln_age_sq",
+    "ln_tc",
+    "ln_age*ln_tc",
+    "ln_hdl",
+    "ln_age*ln_hdl",
+    "ln_sbp_trt",
+    "ln_age*ln_sbp_trt",
+    "ln_sbp_untrt",
+    "ln_age*ln_sbp_untrt",
+    "smoker",
+    "ln_age*smoker",
+    "diabetes",
+)
+
+
+def build_pce_matrix() -> Dict[Tuple[str, str], Tuple[np.ndarray, float, float]]:
+    """Return {(sex, race): (beta_vec, S0, mean_lp)} aligned with PCE_FEATURES."""
+    return {
+        group: (
+            np.array([p.betas.get(f, 0.0) for f in PCE_FEATURES], dtype=np.float64),
+            p.S0,
+            p.mean_lp,
+        )
+        for group, p in _PCE_CONSTANTS.items()
+    }
+
+
+_PCE_MATRIX = build_pce_matrix()
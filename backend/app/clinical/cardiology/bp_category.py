@@ -11,37 +11,96 @@ Categories:
 - Hypertensive Crisis:  ≥180 or ≥120
 """
 
-from uuid import uuid4
+import math
+
+import numpy as np
+
 from app.schemas.cardiology.cardiology import BPCategoryInput, BPCategoryOutput
-from app.clinical.utils import log_usage
+from app.clinical.utils import fast_uuid4, log_usage
 from app.services.registry import register_assessment
 
+# Indexed by the codes stored in ``_BP_TABLE``.
+_CATEGORY_NAMES = (
+    "normal",
+    "elevated",
+    "hypertension_stage_1",
+    "hypertension_stage_2",
+    "hypertensive_crisis",
+)
+
+
+def _build_bp_table(size: int = 256) -> np.ndarray:
+    """
+    Category code for every integer (sbp, dbp) pair in [0, size), plus a
+    last row/column for NaN.
+
+    The table evaluates the ACC/AHA comparison chain on float readings,
+    so NaN keeps its comparison semantics (every test on it is False).
+    All cut-offs are integers, so flooring a finite reading never changes
+    its category.
+    """
+    readings = np.append(np.arange(size, dtype=np.float64), np.nan)
+    sbp = readings[:, None]
+    dbp = readings[None, :]
+    with np.errstate(invalid="ignore"):
+        table = np.select(
+            [
+                (sbp >= 180) | (dbp >= 120),
+                (sbp >= 140) | (dbp >= 90),
+                ((sbp >= 130) & (sbp < 140)) | ((dbp >= 80) & (dbp < 90)),
+                (sbp >= 120) & (sbp < 130) & (dbp < 80),
+            ],
+            [4, 3, 2, 1],
+            default=0,
+        )
+    return table.astype(np.uint8)
+
+
+_BP_TABLE = _build_bp_table()
+_BP_NAN = _BP_TABLE.shape[0] - 1
+_BP_MAX = _BP_NAN - 1
+
+
+def _bp_index(value: float) -> int:
+    """Table index for one reading; infinities clamp to the table edges."""
+    if math.isnan(value):
+        return _BP_NAN
+    if not math.isfinite(value):
+        return _BP_MAX if value > 0 else 0
+    return min(max(math.floor(value), 0), _BP_MAX)
+
+
+def _bp_indices(values) -> np.ndarray:
+    """Vectorized ``_bp_index``."""
+    arr = np.asarray(values, dtype=np.float64)
+    idx = np.clip(np.floor(np.nan_to_num(arr, nan=0.0)), 0, _BP_MAX)
+    return np.where(np.isnan(arr), _BP_NAN, idx).astype(np.intp)
+
+
+def classify_bp_batch(sbp_arr, dbp_arr) -> np.ndarray:
+    """Category codes (index into ``_CATEGORY_NAMES``) for BP arrays."""
+    return _BP_TABLE[_bp_indices(sbp_arr), _bp_indices(dbp_arr)]
+
 
 def categorize_blood_pressure(input_data: BPCategoryInput) -> BPCategoryOutput:
-    try:
-        systolic = input_data.systolic_bp
-        diastolic = input_data.diastolic_bp
+    # Read the input once; the error path reuses these instead of
+    # re-probing input_data.
+    patient_id = getattr(input_data, "patient_id", None)
+    systolic = getattr(input_data, "systolic_bp", None)
+    diastolic = getattr(input_data, "diastolic_bp", None)
 
+    try:
         if systolic is None or diastolic is None:
             raise ValueError("Both systolic and diastolic values are required")
 
         # ACC/AHA 2017 classification
-        if systolic >= 180 or diastolic >= 120:
-            category = "hypertensive_crisis"
-        elif systolic >= 140 or diastolic >= 90:
-            category = "hypertension_stage_2"
-        elif 130 <= systolic < 140 or 80 <= diastolic < 90:
-            category = "hypertension_stage_1"
-        elif 120 <= systolic < 130 and diastolic < 80:
-            category = "elevated"
-        else:
-            category = "normal"
+        category = _CATEGORY_NAMES[_BP_TABLE[_bp_index(systolic), _bp_index(diastolic)]]
 
         # Log usage with metadata (consistent with Alzheimer code)
         log_usage(
             function_name="categorize_blood_pressure",
             metadata={
-                "patient_id": input_data.patient_id,
+                "patient_id": patient_id,
                 "systolic": systolic,
                 "diastolic": diastolic,
                 "category": category,
@@ -49,7 +108,8 @@ def categorize_blood_pressure(input_data: BPCategoryInput) -> BPCategoryOutput:
         )
 
         return BPCategoryOutput(
-            patient_id=input_data.patient_id,
+            prediction_id=fast_uuid4(),
+            patient_id=patient_id,
             systolic_bp=systolic,
             diastolic_bp=diastolic,
             category=category,
@@ -61,27 +121,29 @@ def categorize_blood_pressure(input_data: BPCategoryInput) -> BPCategoryOutput:
         log_usage(
             function_name="categorize_blood_pressure_error",
             metadata={
-                "patient_id": input_data.patient_id if input_data else None,
-                "systolic": getattr(input_data, "systolic_bp", None),
-                "diastolic": getattr(input_data, "diastolic_bp", None),
+                "patient_id": patient_id,
+                "systolic": systolic,
+                "diastolic": diastolic,
                 "error": str(e),
             },
         )
         return BPCategoryOutput(
-            patient_id=input_data.patient_id if input_data else None,
+            prediction_id=fast_uuid4(),
+            patient_id=patient_id,
             category="error",
-            systolic_bp=getattr(input_data, "systolic_bp", None),
-            diastolic_bp=getattr(input_data, "diastolic_bp", None),
+            systolic_bp=systolic,
+            diastolic_bp=diastolic,
             model_version="v1.0",
             model_name="bp_category_rule_v1",
             error=str(e),
         )
 
 register_assessment(
-    name="blood_pressure_category",
+    assessment_type="CARDIOLOGY_BP",
+    specialty="cardiology",
+    predict_fn=categorize_blood_pressure,
     input_schema=BPCategoryInput,
     output_schema=BPCategoryOutput,
-    runner=categorize_blood_pressure,
 )
 
-__all__ = ["categorize_blood_pressure"]
+__all__ = ["categorize_blood_pressure", "classify_bp_batch"]
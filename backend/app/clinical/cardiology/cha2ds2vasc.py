@@ -5,10 +5,59 @@ Reference:
     Lip GYH, et al. Chest. 2010.
 """
 
-from typing import Literal, NamedTuple
+from typing import Literal, NamedTuple, Tuple
+
+import numpy as np
+
 from app.schemas.cardiology.cardiology import CHA2DS2VAScInput, CHA2DS2VAScOutput
 from app.services.registry import register_assessment
 
+_RISK_CATEGORIES = ("low", "moderate", "high")
+
+# Risk category by min(score, 3), indexed [is_female]; the female sex
+# point alone does not raise risk. Same thresholds as _risk_kernel.
+_RISK_BY_SCORE = (
+    ("low", "moderate", "high", "high"),
+    ("low", "low", "moderate", "high"),
+)
+
+
+# ==========================================================
+# Numeric Kernels
+# ==========================================================
+def _score_kernel(age, is_female, chf, htn, dm, vasc, stroke):
+    """
+    Integer CHA₂DS₂-VASc score.
+
+    Works elementwise, so the same rule serves scalars and cohort arrays.
+    The leading integer term keeps numpy from OR-ing bool arrays.
+    """
+    return 2 * stroke + chf + htn + dm + vasc + is_female + (age >= 65) + (age >= 75)
+
+
+def _risk_kernel(score, is_female):
+    """Index into ``_RISK_CATEGORIES``; women need one extra point."""
+    return 1 * (score >= 1 + is_female) + (score >= 2 + is_female)
+
+
+def score_batch(
+    ages, is_female, chf, htn, dm, vasc, stroke
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score a cohort of patients at once.
+
+    All arguments are equal-length integer arrays (flags as 0/1). Returns
+    ``(scores, risk)`` where ``risk`` indexes ``_RISK_CATEGORIES``.
+    Validation is the caller's responsibility.
+    """
+    ages, is_female, chf, htn, dm, vasc, stroke = (
+        np.asarray(a) for a in (ages, is_female, chf, htn, dm, vasc, stroke)
+    )
+    scores = _score_kernel(ages, is_female, chf, htn, dm, vasc, stroke)
+    risk = _risk_kernel(scores, is_female)
+    return scores.astype(np.int32), risk.astype(np.int8)
+
+
 # ==========================================================
 # Core Logic
 # ==========================================================
@@ -25,40 +74,23 @@ def calculate_cha2ds2vasc(data: CHA2DS2VAScInput) -> CHA2DS2VAScOutput:
     # Validation
     if data.age < 0:
         raise ValueError("Age must be non-negative")
-    if data.gender.lower() not in {"male", "female"}:
+    g = data.gender.lower()
+    if g not in {"male", "female"}:
         raise ValueError("Gender must be 'male' or 'female'")
     
-    # Age-based components
-    age_75_or_older = data.age >= 75
-    age_65_to_74 = 65 <= data.age < 75
-    
-    # Calculate total score
+    # Schema fields are already bool / int, so plain addition is enough
+    age = data.age
+    is_female = g == "female"
     score = (
-        int(data.congestive_heart_failure)
-        + int(data.hypertension)
-        + int(data.diabetes)
-        + int(data.vascular_disease)
-        + 2 * int(data.stroke_tia_thromboembolism)
-        + 2 * int(age_75_or_older)
-        + int(age_65_to_74)
-        + (1 if data.gender.lower() == "female" else 0)
+        data.congestive_heart_failure
+        + data.hypertension
+        + data.diabetes
+        + data.vascular_disease
+        + 2 * data.stroke_tia_thromboembolism
+        + (2 if age >= 75 else 1 if age >= 65 else 0)
+        + is_female
     )
-    
-    # Risk category determination
-    if data.gender.lower() == "female":
-        if score >= 3:
-            risk_category = "high"
-        elif score >= 2:
-            risk_category = "moderate"
-        else:
-            risk_category = "low"
-    else:
-        if score >= 2:
-            risk_category = "high"
-        elif score >= 1:
-            risk_category = "moderate"
-        else:
-            risk_category = "low"
+    risk_category = _RISK_BY_SCORE[is_female][min(score, 3)]
     
     return CHA2DS2VAScOutput(
         patient_id=data.patient_id,
@@ -69,9 +101,10 @@ def calculate_cha2ds2vasc(data: CHA2DS2VAScInput) -> CHA2DS2VAScOutput:
     )
 
 register_assessment(
-    name="cha2ds2vasc",
+    assessment_type="CARDIOLOGY_CHA2DS2VASC",
+    specialty="cardiology",
+    predict_fn=calculate_cha2ds2vasc,
     input_schema=CHA2DS2VAScInput,
     output_schema=CHA2DS2VAScOutput,
-    runner=calculate_cha2ds2vasc,
 )
-__all__ = ["calculate_cha2ds2vasc"]
\ No newline at end of file
+__all__ = ["calculate_cha2ds2vasc", "score_batch"]
\ No newline at end of file
@@ -3,31 +3,109 @@ Basic ECG interpretation rules for rhythm, intervals, and morphology.
 This is a rule-based decision-support component, not a standalone diagnostic tool.
 """
 
-from typing import List, Literal
-from uuid import uuid4
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
 from app.schemas.cardiology.cardiology import ECGInterpretationInput, ECGInterpretationOutput
-from app.clinical.utils import log_usage
+from app.clinical.utils import fast_uuid4, log_usage
 from app.services.registry import register_assessment
 
+_RHYTHM_CODE = {"sinus": 0, "afib": 1, "flutter": 2, "other": 3}
+
 # ==========================================================
 # Input Validation
 # ==========================================================
-def _validate_ecg_input(data: ECGInterpretationInput) -> None:
-    """Validate input ranges and values."""
+def _validate_ecg_input(data: ECGInterpretationInput) -> Tuple[str, int]:
+    """Validate input ranges and values; return (rhythm, rhythm code)."""
     if not (20 <= data.heart_rate <= 300):
         raise ValueError("Heart rate must be between 20 and 300 bpm")
     if not (40 <= data.qrs_duration <= 200):
         raise ValueError("QRS duration must be between 40 and 200 ms")
     
-    valid_rhythms = {"sinus", "afib", "flutter", "other"}
-    if data.rhythm.lower() not in valid_rhythms:
-        raise ValueError(f"Rhythm must be one of: {sorted(valid_rhythms)}")
+    rhythm = data.rhythm.lower()
+    r = _RHYTHM_CODE.get(rhythm)
+    if r is None:
+        raise ValueError(f"Rhythm must be one of: {sorted(_RHYTHM_CODE)}")
     
     if data.qt_interval is not None and not (200 <= data.qt_interval <= 600):
         raise ValueError("QT interval must be between 200 and 600 ms (if provided)")
     if data.pr_interval is not None and not (80 <= data.pr_interval <= 400):
         raise ValueError("PR interval must be between 80 and 400 ms (if provided)")
 
+    return rhythm, r
+
+
+# ==========================================================
+# Finding lookup tables
+# ==========================================================
+_RISK_LEVELS = ("routine", "urgent", "emergent")
+
+# One bit per rule, in the order findings are reported.
+# (finding, risk level it raises the overall risk to)
+_FINDING_BITS = (
+    ("first_degree_av_block", 1),   # PR > 200
+    ("short_pr_interval", 1),       # PR < 120 in sinus rhythm
+    ("afib", 1),
+    ("atrial_flutter", 1),
+    ("sinus_tachycardia", 0),       # sinus, HR > 100
+    ("sinus_bradycardia", 0),       # sinus, HR < 60
+    ("wide_qrs_complex", 0),        # QRS > 120
+    ("st_elevation", 2),
+    ("t_wave_inversion", 1),
+    ("prolonged_qt", 1),            # QT > 450
+)
+
+
+def _findings_for_mask(mask: int) -> List[str]:
+    findings = [
+        name for bit, (name, _) in enumerate(_FINDING_BITS) if mask >> bit & 1
+    ]
+    return findings or ["normal"]
+
+
+def _risk_for_mask(mask: int) -> int:
+    return max(
+        (risk for bit, (_, risk) in enumerate(_FINDING_BITS) if mask >> bit & 1),
+        default=0,
+    )
+
+
+_FINDINGS_BY_MASK: List[List[str]] = [
+    _findings_for_mask(m) for m in range(1 << len(_FINDING_BITS))
+]
+_RISK_BY_MASK = np.array(
+    [_risk_for_mask(m) for m in range(1 << len(_FINDING_BITS))],
+    dtype=np.uint8,
+)
+
+
+def _finding_mask(
+    heart_rate: int,
+    qrs_duration: int,
+    qt_interval: Optional[int],
+    pr_interval: Optional[int],
+    r: int,
+    st_elevation: bool,
+    t_wave_inversion: bool,
+) -> int:
+    """Encode every rule outcome as one bit of an integer mask."""
+    sinus = r == 0
+    pr = pr_interval
+    return (
+        (pr is not None and pr > 200)
+        | (pr is not None and pr < 120 and sinus) << 1
+        | (r == 1) << 2
+        | (r == 2) << 3
+        | (sinus and heart_rate > 100) << 4
+        | (sinus and heart_rate < 60) << 5
+        | (qrs_duration > 120) << 6
+        | bool(st_elevation) << 7
+        | bool(t_wave_inversion) << 8
+        | (qt_interval is not None and qt_interval > 450) << 9
+    )
+
 
 # ==========================================================
 # Public API
@@ -42,61 +120,28 @@ def interpret_ecg(data: ECGInterpretationInput) -> ECGInterpretationOutput:
     Returns:
         ECGInterpretationOutput: Interpretation findings, rhythm, risk, and metadata
     """
+    patient_id = getattr(data, "patient_id", None)
+
     try:
         # Validate input
-        _validate_ecg_input(data)
-        
-        findings: List[str] = []
-        rhythm = data.rhythm.lower()
-        overall_risk: Literal["routine", "urgent", "emergent"] = "routine"
-
-        # PR interval assessment
-        if data.pr_interval is not None:
-            if data.pr_interval > 200:
-                findings.append("first_degree_av_block")
-                overall_risk = "urgent" if overall_risk == "routine" else overall_risk
-            elif data.pr_interval < 120 and rhythm == "sinus":
-                findings.append("short_pr_interval")
-                overall_risk = "urgent" if overall_risk == "routine" else overall_risk
-
-        # Rhythm assessment
-        if rhythm == "afib":
-            findings.append("afib")
-            overall_risk = "urgent"
-        elif rhythm == "flutter":
-            findings.append("atrial_flutter")
-            overall_risk = "urgent"
-
-        # Heart rate assessment (for sinus rhythm)
-        if rhythm == "sinus":
-            if data.heart_rate > 100:
-                findings.append("sinus_tachycardia")
-            elif data.heart_rate < 60:
-                findings.append("sinus_bradycardia")
-
-        # QRS duration assessment
-        if data.qrs_duration > 120:
-            findings.append("wide_qrs_complex")
-
-        # ST segment and T-wave assessment (critical findings)
-        if data.st_elevation:
-            findings.append("st_elevation")
-            overall_risk = "emergent"
-        if data.t_wave_inversion:
-            findings.append("t_wave_inversion")
-            overall_risk = "urgent" if overall_risk == "routine" else overall_risk
-
-        # QT interval assessment
-        if data.qt_interval is not None and data.qt_interval > 450:
-            findings.append("prolonged_qt")
-            overall_risk = "urgent" if overall_risk == "routine" else overall_risk
-
-        # Default to normal if no abnormalities found
-        if not findings:
-            findings.append("normal")
+        rhythm, r = _validate_ecg_input(data)
+
+        mask = _finding_mask(
+            data.heart_rate,
+            data.qrs_duration,
+            data.qt_interval,
+            data.pr_interval,
+            r,
+            data.st_elevation,
+            data.t_wave_inversion,
+        )
+
+        findings = list(_FINDINGS_BY_MASK[mask])
+        overall_risk = _RISK_LEVELS[_RISK_BY_MASK[mask]]
 
         output = ECGInterpretationOutput(
-            patient_id=data.patient_id,
+            prediction_id=fast_uuid4(),
+            patient_id=patient_id,
             findings=findings,
             rhythm=rhythm,
             overall_risk=overall_risk,
@@ -108,9 +153,9 @@ def interpret_ecg(data: ECGInterpretationInput) -> ECGInterpretationOutput:
         log_usage(
             function_name="interpret_ecg",
             metadata={
-                "patient_id": data.patient_id,
-                "input": data.model_dump(),
-                "output": output.model_dump(),
+                "patient_id": patient_id,
+                "input": data,
+                "output": output,
             },
         )
 
@@ -120,13 +165,14 @@ def interpret_ecg(data: ECGInterpretationInput) -> ECGInterpretationOutput:
         log_usage(
             function_name="interpret_ecg_error",
             metadata={
-                "patient_id": getattr(data, "patient_id", None),
+                "patient_id": patient_id,
                 "error": str(e),
-                "input": data.model_dump() if data else {},
+                "input": data if data else {},
             },
         )
         return ECGInterpretationOutput(
-            patient_id=getattr(data, "patient_id", None),
+            prediction_id=fast_uuid4(),
+            patient_id=patient_id,
             findings=["error"],
             rhythm="unknown",
             overall_risk="routine",
@@ -135,11 +181,73 @@ def interpret_ecg(data: ECGInterpretationInput) -> ECGInterpretationOutput:
             error=str(e)
         )
 
+
+def interpret_ecg_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized ECG interpretation for a cohort DataFrame.
+
+    Expects the ECGInterpretationInput columns (qt_interval /
+    pr_interval may be NaN). Returns ``findings`` and ``overall_risk``
+    columns aligned with ``df``; rows failing validation get
+    ``["error"]`` / "routine", matching the scalar error output.
+    """
+    def column(name: str, default: object, dtype: type) -> np.ndarray:
+        if name not in df:
+            return np.full(len(df), default, dtype=dtype)
+        return df[name].fillna(default).to_numpy(dtype=dtype)
+
+    hr = df["heart_rate"].to_numpy(dtype=np.float64)
+    qrs = df["qrs_duration"].to_numpy(dtype=np.float64)
+    qt = column("qt_interval", np.nan, np.float64)
+    pr = column("pr_interval", np.nan, np.float64)
+    st = column("st_elevation", False, bool)
+    tw = column("t_wave_inversion", False, bool)
+    r = df["rhythm"].str.lower().map(_RHYTHM_CODE).to_numpy(dtype=np.float64)
+
+    valid = (
+        (hr >= 20) & (hr <= 300)
+        & (qrs >= 40) & (qrs <= 200)
+        & ~np.isnan(r)
+        & (np.isnan(qt) | ((qt >= 200) & (qt <= 600)))
+        & (np.isnan(pr) | ((pr >= 80) & (pr <= 400)))
+    )
+
+    sinus = r == 0
+    bits = (
+        (pr > 200),
+        (pr < 120) & sinus,
+        r == 1,
+        r == 2,
+        sinus & (hr > 100),
+        sinus & (hr < 60),
+        qrs > 120,
+        st,
+        tw,
+        qt > 450,
+    )
+    mask = np.zeros(len(df), dtype=np.int64)
+    for bit, flag in enumerate(bits):
+        mask |= flag.astype(np.int64) << bit
+
+    risk_names = np.array(_RISK_LEVELS, dtype=object)
+    findings = [
+        list(_FINDINGS_BY_MASK[m]) if ok else ["error"]
+        for m, ok in zip(mask.tolist(), valid.tolist())
+    ]
+    overall_risk = np.where(valid, risk_names[_RISK_BY_MASK[mask]], "routine")
+
+    return pd.DataFrame(
+        {"findings": findings, "overall_risk": overall_risk},
+        index=df.index,
+    )
+
+
 register_assessment(
-    name="ecg_interpretation",
+    assessment_type="CARDIOLOGY_ECG",
+    specialty="cardiology",
+    predict_fn=interpret_ecg,
     input_schema=ECGInterpretationInput,
     output_schema=ECGInterpretationOutput,
-    runner=interpret_ecg,
 )
 
-__all__ = ["interpret_ecg"]
+__all__ = ["interpret_ecg", "interpret_ecg_batch"]
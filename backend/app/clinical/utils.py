@@ -7,18 +7,28 @@ logging, helper functions, and video conversion.
 
 from __future__ import annotations
 
+import atexit
+import logging
 import os
+import queue
+import threading
 import uuid
 import subprocess
+import warnings
 import joblib
 import tempfile
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 from functools import lru_cache
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Callable, Dict, Optional, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+# Child of the "clinovia" logger so records use its JSON handler
+logger = logging.getLogger("clinovia.clinical")
+
 # ============================================================
 # GLOBAL CONFIG — MODEL ROOT RESOLUTION (ROBUST)
 # ============================================================
@@ -38,7 +48,7 @@ def _resolve_model_root() -> Path:
     if env_path:
         p = Path(env_path).expanduser().resolve()
         if p.exists():
-            print(f"✅ MODEL_ROOT resolved via ENV: {p}")
+            logger.info("MODEL_ROOT resolved via ENV: %s", p)
             return p
 
     # Base project root (…/app/)
@@ -52,7 +62,7 @@ def _resolve_model_root() -> Path:
 
     for path in candidates:
         if path.exists():
-            print(f"✅ MODEL_ROOT resolved: {path.resolve()}")
+            logger.info("MODEL_ROOT resolved: %s", path.resolve())
             return path.resolve()
 
     # ❌ Nothing worked
@@ -114,6 +124,68 @@ def fill_defaults(
     return filled
 
 
+# ============================================================
+# SCALER FAST PATH
+# ============================================================
+
+# Set CLINOVIA_FAST_SCALER=false to route every transform through sklearn.
+FAST_SCALER_ENABLED = os.getenv("CLINOVIA_FAST_SCALER", "true").lower() == "true"
+
+
+@dataclass(frozen=True)
+class _ScalerSnapshot:
+    """Fitted StandardScaler parameters captured as plain ndarrays."""
+    mean: np.ndarray
+    scale: np.ndarray
+    inv_scale: np.ndarray
+
+
+def _snapshot_scaler(scaler: Any) -> Optional[_ScalerSnapshot]:
+    """
+    Capture mean/scale once per loaded scaler.
+
+    Returns None for scalers that don't expose StandardScaler
+    attributes, so callers fall back to scaler.transform().
+    """
+    snapshot = getattr(scaler, "_clinovia_snapshot", None)
+    if snapshot is not None:
+        return snapshot
+
+    n_features = getattr(scaler, "n_features_in_", None)
+    if n_features is None or not hasattr(scaler, "with_mean"):
+        return None
+
+    mean = getattr(scaler, "mean_", None)
+    scale = getattr(scaler, "scale_", None)
+
+    if not getattr(scaler, "with_mean", True) or mean is None:
+        mean = np.zeros(n_features)
+    if not getattr(scaler, "with_std", True) or scale is None:
+        scale = np.ones(n_features)
+
+    scale = np.asarray(scale, dtype=np.float64)
+    snapshot = _ScalerSnapshot(
+        mean=np.asarray(mean, dtype=np.float64),
+        scale=scale,
+        inv_scale=1.0 / scale,
+    )
+    scaler._clinovia_snapshot = snapshot
+    return snapshot
+
+
+def scale_features(scaler: Any, X: np.ndarray) -> np.ndarray:
+    """
+    Standardize X with a fitted scaler.
+
+    Skips sklearn's per-call validation by applying the
+    cached (X - mean) * inv_scale directly when possible.
+    """
+    snapshot = _snapshot_scaler(scaler) if FAST_SCALER_ENABLED else None
+    if snapshot is None:
+        return scaler.transform(X)
+    return (X - snapshot.mean) * snapshot.inv_scale
+
+
 # ============================================================
 # PREPROCESSING HELPERS
 # ============================================================
@@ -137,21 +209,105 @@ def preprocess_for_prediction_dataframe(
     categorical_columns: List[str],
     scaler: Optional[Any] = None,
 ) -> pd.DataFrame:
-    """Return preprocessed input as a pandas DataFrame."""
+    """
+    Return preprocessed input as a pandas DataFrame.
+
+    Kept for training notebooks and debugging; inference goes
+    through preprocess_for_prediction / make_preprocessor.
+    """
     data = fill_defaults(input_data, numeric_defaults, categorical_defaults)
     _encode_categoricals(data, categorical_columns)
 
-    numeric_df = pd.DataFrame([[data[col] for col in numeric_columns]],
-                              columns=numeric_columns)
-
+    numeric = np.array([[data[col] for col in numeric_columns]], dtype=np.float64)
     if scaler:
-        numeric_df[:] = scaler.transform(numeric_df)
+        numeric = scale_features(scaler, numeric)
+
+    row = dict(zip(numeric_columns, numeric[0].tolist()))
+    row.update({col: data[col] for col in categorical_columns})
+    return pd.DataFrame([row], columns=feature_order)
+
+
+def _check_feature_names(estimator: Any, expected: List[str], what: str) -> None:
+    """Raise if a fitted estimator's feature_names_in_ differ from ``expected``."""
+    names = getattr(estimator, "feature_names_in_", None)
+    if names is not None and list(names) != list(expected):
+        raise ValueError(
+            f"Feature mismatch: {what} was fitted on {list(names)}, "
+            f"got {list(expected)}"
+        )
 
-    categorical_df = pd.DataFrame([[data[col] for col in categorical_columns]],
-                                  columns=categorical_columns)
 
-    X = pd.concat([numeric_df, categorical_df], axis=1)
-    return X.reindex(columns=feature_order)
+def make_preprocessor(
+    numeric_columns: List[str],
+    categorical_columns: List[str],
+    feature_order: List[str],
+    scaler: Optional[Any] = None,
+    model: Optional[Any] = None,
+) -> Callable[[Dict[str, Any]], np.ndarray]:
+    """
+    Build a row preprocessor bound to one model's schema.
+
+    Column positions and scaler parameters are resolved once here; the
+    returned closure takes an already filled / encoded input dict and
+    writes a (1, n_features) float64 row in feature_order directly,
+    without any intermediate DataFrames.
+
+    The rows carry no column names, so order is checked here instead:
+    feature_order against the model's feature_names_in_, and
+    numeric_columns against the scaler's (it scales them positionally).
+    """
+    position = {col: i for i, col in enumerate(feature_order)}
+    missing = [c for c in feature_order
+               if c not in numeric_columns and c not in categorical_columns]
+    unknown = [c for c in (*numeric_columns, *categorical_columns)
+               if c not in position]
+    if missing or unknown:
+        raise ValueError(
+            f"Feature mismatch: missing {missing}, not in feature_order {unknown}"
+        )
+    if model is not None:
+        _check_feature_names(model, feature_order, "model")
+    if scaler is not None:
+        _check_feature_names(scaler, numeric_columns, "scaler")
+
+    numeric_columns = tuple(numeric_columns)
+    categorical_columns = tuple(categorical_columns)
+    num_idx = np.array([position[c] for c in numeric_columns], dtype=np.intp)
+    cat_idx = np.array([position[c] for c in categorical_columns], dtype=np.intp)
+    n_features = len(feature_order)
+
+    snapshot = None
+    if scaler is not None and FAST_SCALER_ENABLED:
+        snapshot = _snapshot_scaler(scaler)
+
+    def preprocess(data: Dict[str, Any]) -> np.ndarray:
+        raw_num = np.array([data[c] for c in numeric_columns], dtype=np.float64)
+        if snapshot is not None:
+            raw_num -= snapshot.mean
+            raw_num *= snapshot.inv_scale
+        elif scaler is not None:
+            raw_num = scaler.transform(raw_num[np.newaxis, :])[0]
+
+        out = np.empty((1, n_features), dtype=np.float64)
+        out[0, num_idx] = raw_num
+        out[0, cat_idx] = [data[c] for c in categorical_columns]
+        return out
+
+    return preprocess
+
+
+@lru_cache(maxsize=64)
+def _bound_preprocessor(
+    numeric_columns: Tuple[str, ...],
+    categorical_columns: Tuple[str, ...],
+    feature_order: Tuple[str, ...],
+    scaler: Optional[Any],
+    model: Optional[Any],
+) -> Callable[[Dict[str, Any]], np.ndarray]:
+    return make_preprocessor(
+        list(numeric_columns), list(categorical_columns),
+        list(feature_order), scaler, model,
+    )
 
 
 def preprocess_for_prediction(
@@ -162,24 +318,55 @@ def preprocess_for_prediction(
     numeric_columns: List[str],
     categorical_columns: List[str],
     scaler: Optional[Any] = None,
+    model: Optional[Any] = None,
 ) -> np.ndarray:
-    """Return preprocessed input as numpy array."""
-    df = preprocess_for_prediction_dataframe(
-        input_data,
-        numeric_defaults,
-        categorical_defaults,
-        feature_order,
-        numeric_columns,
-        categorical_columns,
+    """
+    Return preprocessed input as numpy array.
+
+    Pass the loaded ``model`` so its feature order is validated once
+    per (model, scaler) pair; see make_preprocessor.
+    """
+    data = fill_defaults(input_data, numeric_defaults, categorical_defaults)
+    _encode_categoricals(data, categorical_columns)
+
+    preprocess = _bound_preprocessor(
+        tuple(numeric_columns),
+        tuple(categorical_columns),
+        tuple(feature_order),
         scaler,
+        model,
     )
+    return preprocess(data)
 
-    X = df.to_numpy(dtype=float)
-    if X.shape[1] != len(feature_order):
-        raise ValueError(
-            f"Feature mismatch: expected {len(feature_order)}, got {X.shape[1]}"
-        )
-    return X
+
+# make_preprocessor checks column order against feature_names_in_ when it
+# binds a model, so sklearn's warning about bare arrays carries no signal.
+# Installed once: catch_warnings per call is process-wide and not thread-safe.
+warnings.filterwarnings(
+    "ignore",
+    message="X does not have valid feature names",
+    category=UserWarning,
+    module="sklearn",
+)
+
+
+def predict_proba_validated(model: Any, X: np.ndarray) -> np.ndarray:
+    """
+    predict_proba on a bare array from preprocess_for_prediction.
+
+    Column order was checked against feature_names_in_ when the
+    preprocessor was bound.
+    """
+    return model.predict_proba(X)
+
+
+def bucket_progression_risk(prob_progress: np.ndarray) -> np.ndarray:
+    """Map progression probabilities to low / moderate / high."""
+    return np.where(
+        prob_progress < 0.2,
+        "low",
+        np.where(prob_progress < 0.5, "moderate", "high"),
+    )
 
 
 def build_df_from_order(
@@ -194,11 +381,121 @@ def build_df_from_order(
 # MODEL LOADING (LOCAL-FIRST, NO S3)
 # ============================================================
 
+# Set CLINOVIA_USE_ONNX=false to ignore exported .onnx siblings.
+USE_ONNX = os.getenv("CLINOVIA_USE_ONNX", "true").lower() == "true"
+
+
+# Set CLINOVIA_MMAP_MODELS=false to load pickled arrays onto the heap.
+MMAP_MODELS = os.getenv("CLINOVIA_MMAP_MODELS", "true").lower() == "true"
+
+
 @lru_cache(maxsize=32)
 def _load_joblib(path: Path) -> Any:
+    """
+    Load a joblib artifact, memory-mapping its numpy arrays read-only.
+
+    Arrays stay file-backed in the page cache (shared between worker
+    processes) instead of being copied into each process's heap.
+    """
     if not path.exists():
         raise FileNotFoundError(f"Model file not found: {path}")
-    return joblib.load(path)
+    return joblib.load(path, mmap_mode="r" if MMAP_MODELS else None)
+
+
+class MmapScaler:
+    """
+    StandardScaler-compatible view over a memory-mapped ``.npy`` file.
+
+    The file written by tools/convert_scalers_to_npy.py holds a single
+    (2, n_features) float64 array: row 0 is ``mean_``, row 1 is
+    ``scale_``. Mapping it read-only lets every worker process share
+    the same page-cache copy instead of unpickling its own. A
+    ``.features.npy`` sibling, when present, restores ``feature_names_in_``.
+    """
+
+    with_mean = True
+    with_std = True
+
+    def __init__(
+        self,
+        params: np.ndarray,
+        feature_names: Optional[np.ndarray] = None,
+    ) -> None:
+        self.mean_ = params[0]
+        self.scale_ = params[1]
+        self.n_features_in_ = params.shape[1]
+        if feature_names is not None:
+            self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+
+    def transform(self, X: Any) -> np.ndarray:
+        return (np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_
+
+
+def _fadvise_willneed(path: Path) -> None:
+    """Ask the kernel to start reading ``path`` into the page cache."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=32)
+def _load_scaler_mmap(path: Path) -> MmapScaler:
+    _fadvise_willneed(path)
+    params = np.load(path, mmap_mode="r", allow_pickle=False)
+    if params.ndim != 2 or params.shape[0] != 2:
+        raise ValueError(f"Unexpected scaler layout {params.shape} in {path}")
+
+    names_path = path.with_suffix(".features.npy")
+    feature_names = None
+    if names_path.exists():
+        feature_names = np.load(names_path, allow_pickle=False)
+        if feature_names.shape != (params.shape[1],):
+            raise ValueError(f"Feature names do not match {path}")
+    return MmapScaler(params, feature_names)
+
+
+class OnnxClassifier:
+    """
+    predict_proba-compatible wrapper around an ONNX Runtime session.
+
+    Tree ensembles exported by tools/convert_models_to_onnx.py are
+    evaluated by onnxruntime's TreeEnsembleClassifier kernel, which
+    walks contiguous threshold / feature / leaf arrays instead of
+    per-tree node structs.
+    """
+
+    def __init__(self, session: Any) -> None:
+        self._session = session
+        self._input_name = session.get_inputs()[0].name
+        self._proba_name = session.get_outputs()[-1].name
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        return self._session.run([self._proba_name], {self._input_name: X})[0]
+
+
+@lru_cache(maxsize=32)
+def _load_onnx(path: Path) -> Optional[OnnxClassifier]:
+    """Load an ONNX model pinned to one thread; None if onnxruntime is absent."""
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        return None
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+
+    session = ort.InferenceSession(
+        str(path),
+        sess_options=options,
+        providers=["CPUExecutionProvider"],
+    )
+    return OnnxClassifier(session)
 
 
 def load_model(
@@ -208,46 +505,238 @@ def load_model(
     """
     Load model and optional preprocessor from local disk.
 
-    Paths are relative to MODEL_ROOT.
+    Paths are relative to MODEL_ROOT. If an exported ``.onnx``
+    sibling exists and onnxruntime is installed, it is served
+    instead of the pickle. Likewise a ``.npy`` sibling of the
+    preprocessor is memory-mapped instead of unpickling it.
 
     Example:
         load_model(
             "alzheimer/diagnosis/basic/v1/model.pkl",
             "alzheimer/diagnosis/basic/v1/scaler.pkl"
         )
+
+    Results are memoised per (model, preprocessor) pair; artifacts are
+    versioned by path, so a cached pair never goes stale.
     """
+    return _load_model_cached(model_rel_path, preprocessor_rel_path)
+
+
+@lru_cache(maxsize=16)
+def _load_model_cached(
+    model_rel_path: str,
+    preprocessor_rel_path: Optional[str],
+) -> Tuple[Any, Optional[Any]]:
     model_path = MODEL_ROOT / model_rel_path
-    print(f"📦 Loading model: {model_path}")
-    model = _load_joblib(model_path)
+    onnx_path = model_path.with_suffix(".onnx")
+
+    model = None
+    if USE_ONNX and onnx_path.exists():
+        logger.info("Loading ONNX model: %s", onnx_path)
+        model = _load_onnx(onnx_path)
+
+    if model is None:
+        logger.info("Loading model: %s", model_path)
+        model = _load_joblib(model_path)
+        _pin_single_thread(model)
 
     preprocessor = None
     if preprocessor_rel_path:
         pre_path = MODEL_ROOT / preprocessor_rel_path
-        print(f"📦 Loading preprocessor: {pre_path}")
-        preprocessor = _load_joblib(pre_path)
+        npy_path = pre_path.with_suffix(".npy")
+        if npy_path.exists():
+            logger.info("Mapping preprocessor: %s", npy_path)
+            preprocessor = _load_scaler_mmap(npy_path)
+        else:
+            logger.info("Loading preprocessor: %s", pre_path)
+            preprocessor = _load_joblib(pre_path)
+        _snapshot_scaler(preprocessor)
 
     return model, preprocessor
 
 
+def _pin_single_thread(model: Any) -> None:
+    """
+    Force n_jobs=1 on a loaded estimator (and pipeline steps).
+
+    Models pickled with n_jobs=-1 spin up a joblib pool on every
+    predict call, which dominates latency for single-row requests.
+    """
+    for step in getattr(model, "steps", None) or [(None, model)]:
+        estimator = step[1]
+        if getattr(estimator, "n_jobs", None) not in (None, 1):
+            estimator.n_jobs = 1
+
+
+def _model_manifest() -> List[Tuple[str, Optional[str]]]:
+    """(model, preprocessor) paths relative to MODEL_ROOT, found by naming convention."""
+    manifest = []
+    for pattern in ("*_model.pkl", "*_model.joblib"):
+        for model_path in sorted(MODEL_ROOT.rglob(pattern)):
+            scaler_path = model_path.with_name(
+                model_path.name.replace("_model", "_scaler")
+            ).with_suffix(".pkl")
+            manifest.append((
+                str(model_path.relative_to(MODEL_ROOT)),
+                str(scaler_path.relative_to(MODEL_ROOT))
+                if scaler_path.exists() else None,
+            ))
+    return manifest
+
+
+def preload_all_models(max_workers: int = 8) -> Dict[str, bool]:
+    """
+    Load every model under MODEL_ROOT into the load_model caches.
+
+    Meant for application startup so the first request per model
+    doesn't pay the unpickle. Loads are independent, so they run on a
+    small thread pool to overlap file I/O. Failures are reported, not raised.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _preload(entry: Tuple[str, Optional[str]]) -> bool:
+        model_rel_path, preprocessor_rel_path = entry
+        try:
+            load_model(model_rel_path, preprocessor_rel_path)
+            return True
+        except Exception as exc:
+            logger.warning("Failed to preload %s: %s", model_rel_path, exc)
+            return False
+
+    manifest = _model_manifest()
+    if not manifest:
+        return {}
+
+    workers = max(1, min(max_workers, len(manifest)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_preload, manifest))
+
+    return {entry[0]: ok for entry, ok in zip(manifest, results)}
+
+
 def is_model_loaded(model: Optional[Any]) -> bool:
     """Check if a model object is loaded."""
     return model is not None
 
 
+# ============================================================
+# PREDICTION IDS
+# ============================================================
+
+_UUID_BATCH = 256
+_UUID_POOL: deque[uuid.UUID] = deque()
+
+
+def _refill_uuid_pool() -> None:
+    """Draw entropy for a whole batch of ids with one os.urandom call."""
+    raw = os.urandom(16 * _UUID_BATCH)
+    _UUID_POOL.extend(
+        uuid.UUID(bytes=raw[i:i + 16], version=4)
+        for i in range(0, len(raw), 16)
+    )
+
+
+def fast_uuid4() -> uuid.UUID:
+    """Random (version 4) UUID served from a pre-generated pool."""
+    while True:
+        try:
+            return _UUID_POOL.popleft()
+        except IndexError:
+            _refill_uuid_pool()
+
+
+def fast_uuid_hex() -> str:
+    return fast_uuid4().hex
+
+
 # ============================================================
 # LOGGING
 # ============================================================
 
+# Usage records are queued by request threads and handed to the logger
+# by a single daemon thread, so callers never contend on handler locks.
+_LOG_Q: queue.SimpleQueue[Any] = queue.SimpleQueue()
+_LOG_BATCH_SIZE = 512
+_LOG_STOP = object()
+
+# Set CLINOVIA_USAGE_LOG=false to drop usage records before they are queued.
+USAGE_LOG_ENABLED = os.getenv("CLINOVIA_USAGE_LOG", "true").lower() == "true"
+
+
+def _materialize(value: Any) -> Any:
+    """Snapshot Pydantic models passed to log_usage as plain dicts."""
+    dump = getattr(value, "model_dump", None)
+    return dump(mode="json", exclude_none=True) if callable(dump) else value
+
+
+def _emit_usage(
+    function_name: str,
+    metadata: Optional[dict],
+    result: Optional[dict],
+) -> None:
+    logger.info(
+        function_name,
+        extra={"metadata": metadata or {}, "result": result or {}},
+    )
+
+
+def _flush_loop() -> None:
+    while True:
+        batch = [_LOG_Q.get()]
+        while len(batch) < _LOG_BATCH_SIZE:
+            try:
+                batch.append(_LOG_Q.get_nowait())
+            except queue.Empty:
+                break
+
+        stop = _LOG_STOP in batch
+        if stop:
+            batch = batch[:batch.index(_LOG_STOP)]
+
+        for entry in batch:
+            try:
+                _emit_usage(*entry)
+            except Exception:
+                # never let a bad record kill the flusher, but leave a trace
+                logger.debug("Dropped usage record %s", entry[0], exc_info=True)
+
+        if stop:
+            return
+
+
+_LOG_THREAD = threading.Thread(
+    target=_flush_loop,
+    name="clinovia-usage-log",
+    daemon=True,
+)
+_LOG_THREAD.start()
+
+
+def _flush_loop_drain(timeout: float = 2.0) -> None:
+    """Stop the flusher after it has written everything queued so far."""
+    _LOG_Q.put(_LOG_STOP)
+    _LOG_THREAD.join(timeout)
+
+
+atexit.register(_flush_loop_drain)
+
+
 def log_usage(
     function_name: str,
     metadata: Optional[dict] = None,
     result: Optional[dict] = None,
 ) -> None:
-    print(
-        f"[{function_name}] "
-        f"METADATA={metadata or {}} "
-        f"RESULT={result or {}}"
-    )
+    """
+    Enqueue a usage record; the write happens off-thread.
+
+    Pydantic metadata values are dumped here, so the record reflects
+    what the caller returned even if the object changes afterwards.
+    """
+    if not USAGE_LOG_ENABLED or not logger.isEnabledFor(logging.INFO):
+        return
+    if metadata:
+        metadata = {k: _materialize(v) for k, v in metadata.items()}
+    _LOG_Q.put((function_name, metadata, result))
 
 
 # ============================================================
@@ -259,8 +748,15 @@ __all__ = [
     "fill_defaults",
     "preprocess_for_prediction",
     "preprocess_for_prediction_dataframe",
+    "make_preprocessor",
+    "predict_proba_validated",
+    "bucket_progression_risk",
+    "scale_features",
     "build_df_from_order",
     "load_model",
+    "preload_all_models",
     "is_model_loaded",
+    "fast_uuid4",
+    "fast_uuid_hex",
     "log_usage",
 ]
@@ -2,6 +2,8 @@
 import logging
 import sys
 
+import orjson
+
 from app.core.config import settings
 from pythonjsonlogger import jsonlogger
 
@@ -16,6 +18,14 @@ class SafeJsonFormatter(jsonlogger.JsonFormatter):
         # Never log raw input data, patient info, or model inputs
         # Only log metadata: user_id, prediction_id, model_name
 
+    def jsonify_log_record(self, log_record):
+        # orjson instead of the stdlib encoder; str() anything it can't encode
+        return orjson.dumps(
+            log_record,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
 
 def setup_logger(name: str = "clinovia") -> logging.Logger:
     logger = logging.getLogger(name)
@@ -32,6 +32,8 @@ from app.core.supabase_client import supabase
 from app.core.middleware.request_id_middleware import RequestIDMiddleware
 from app.core.middleware.error_handling_middleware import ErrorHandlingMiddleware
 
+from app.clinical.utils import preload_all_models
+
 # ------------------------------------------------------------------
 # API routers
 # ------------------------------------------------------------------
@@ -107,13 +109,15 @@ async def lifespan(app: FastAPI):
 
     try:
 
-        # Load ML models or heavy resources here
-        state.models_loaded = True
+        # Warm the model caches before the first request
+        model_status = preload_all_models()
+        state.models_loaded = all(model_status.values())
 
         logger.info(
             {
                 "event": "models_loaded",
-                "status": "success",
+                "status": "success" if state.models_loaded else "partial",
+                "models": model_status,
             }
         )
 
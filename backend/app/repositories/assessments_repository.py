@@ -1,7 +1,25 @@
 # backend/app/repositories/assessments_repository.py
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import httpx
+from postgrest.exceptions import APIError
 from supabase import Client
 
+# Columns for list views that don't need the input/result/error JSON
+# payloads; opt in with get_by_clinician(..., summary_only=True).
+SUMMARY_COLUMNS = (
+    "id,clinician_id,patient_id,assessment_type,specialty,"
+    "model_name,model_version,status,pdf_url,created_at"
+)
+
+# Rows per multi-row INSERT in create_many
+INSERT_PAGE_SIZE = 500
+
+# What a failed insert request can raise (PostgREST, transport, _handle_response)
+INSERT_ERRORS = (APIError, httpx.HTTPError, RuntimeError)
+
 
 class AssessmentsRepository:
     """
@@ -41,6 +59,18 @@ class AssessmentsRepository:
         data = self._handle_response(response)
         return data[0]
 
+    @staticmethod
+    def _parse_cursor(cursor: Tuple[Any, Any]) -> Tuple[str, str]:
+        """Canonical (created_at, id) strings for a keyset cursor."""
+        created_at, last_id = cursor
+        try:
+            return (
+                datetime.fromisoformat(str(created_at)).isoformat(),
+                str(UUID(str(last_id))),
+            )
+        except ValueError as exc:
+            raise ValueError(f"Invalid assessments cursor: {exc}") from exc
+
     # -----------------------------
     # Read by ID (PDF generation)
     # -----------------------------
@@ -62,33 +92,104 @@ class AssessmentsRepository:
     # Read by clinician (dashboard)
     # -----------------------------
 
-    def get_by_clinician(self, clinician_id: str) -> List[Dict[str, Any]]:
-        response = (
+    def get_by_clinician(
+        self,
+        clinician_id: str,
+        summary_only: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Newest-first assessments for a clinician.
+
+        Pass ``limit`` to page and ``cursor=(created_at, id)`` of the last
+        row seen to fetch the next page (keyset pagination, no OFFSET).
+        ``created_at`` must be an ISO datetime and ``id`` a UUID; anything
+        else raises ValueError. ``summary_only`` skips the JSON payload
+        columns.
+        """
+        columns = SUMMARY_COLUMNS if summary_only else "*"
+
+        query = (
             self.supabase
             .table(self.table_name)
-            .select("*")
+            .select(columns)
             .eq("clinician_id", clinician_id)
-            .order("created_at", desc=True)
-            .execute()
         )
 
-        data = self._handle_response(response)
+        if cursor:
+            # (created_at, id) < cursor; canonical values can't break the filter
+            created_at, last_id = self._parse_cursor(cursor)
+            query = query.or_(
+                f'created_at.lt."{created_at}",'
+                f'and(created_at.eq."{created_at}",id.lt."{last_id}")'
+            )
+
+        query = query.order("created_at", desc=True).order("id", desc=True)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        data = self._handle_response(query.execute())
         return data
 
     # -----------------------------
     # Batch insert (for CSV upload)
     # -----------------------------
 
-    def create_many(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        response = (
-            self.supabase
-            .table(self.table_name)
-            .insert(records)
-            .execute()
-        )
-
-        data = self._handle_response(response)
-        return data
+    def create_many(
+        self,
+        records: List[Dict[str, Any]],
+        page_size: int = INSERT_PAGE_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """Multi-row insert, one request per page of records."""
+        created: List[Dict[str, Any]] = []
+
+        for start in range(0, len(records), page_size):
+            response = (
+                self.supabase
+                .table(self.table_name)
+                .insert(records[start:start + page_size])
+                .execute()
+            )
+            created.extend(self._handle_response(response))
+
+        return created
+
+    def create_many_isolated(
+        self,
+        records: List[Dict[str, Any]],
+        page_size: int = INSERT_PAGE_SIZE,
+    ) -> List[Optional[str]]:
+        """
+        Multi-row insert that keeps failures to the records that caused them.
+
+        A page whose insert fails is retried one record at a time. Returns
+        one error message (or None on success) per record, in input order.
+        """
+        errors: List[Optional[str]] = []
+
+        for start in range(0, len(records), page_size):
+            page = records[start : start + page_size]
+            try:
+                self.create_many(page, page_size=len(page))
+            except INSERT_ERRORS:
+                errors.extend(self._create_each(page))
+            else:
+                errors.extend([None] * len(page))
+
+        return errors
+
+    def _create_each(self, records: List[Dict[str, Any]]) -> List[Optional[str]]:
+        errors: List[Optional[str]] = []
+        for record in records:
+            try:
+                self.create(record)
+            except INSERT_ERRORS as exc:
+                errors.append(str(exc))
+            else:
+                errors.append(None)
+        return errors
     
     # -----------------------------
     # Update PDF URL
@@ -1,13 +1,14 @@
 # app/services/alzheimer/alzheimer_batch_service.py
 
 from fastapi import BackgroundTasks, UploadFile
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from uuid import uuid4
 import csv
 import io
 
 from app.schemas.alzheimer.diagnosis_basic import AlzheimerDiagnosisBasicInput, dict as model_dict
 from app.clinical.alzheimer.ml_models.diagnosis_basic import predict_cognitive_status_basic
+from app.repositories.assessments_repository import AssessmentsRepository
 
 from supabase import create_client, Client
 
@@ -47,6 +48,7 @@ class AlzheimerBatchService:
                 file_bytes = await file.read()
                 rows = self._parse_csv(file_bytes)
                 results: List[Dict[str, Any]] = []
+                pending: List[Tuple[int, Dict[str, Any]]] = []
 
                 for index, row in enumerate(rows):
                     try:
@@ -76,13 +78,23 @@ class AlzheimerBatchService:
                             "result": result_data,
                         }
 
-                        # Insert into Supabase
-                        supabase.table(supabase_table).insert(record).execute()
-
-                        results.append({"row": index + 1, "status": "completed"})
+                        pending.append((index + 1, record))
                     except Exception as row_err:
                         results.append({"row": index + 1, "status": "failed", "error": str(row_err)})
 
+                repository = AssessmentsRepository(supabase, supabase_table)
+                insert_errors = repository.create_many_isolated(
+                    [record for _, record in pending]
+                )
+                for (row_number, _), error in zip(pending, insert_errors, strict=True):
+                    if error is None:
+                        results.append({"row": row_number, "status": "completed"})
+                    else:
+                        results.append(
+                            {"row": row_number, "status": "failed", "error": error}
+                        )
+                results.sort(key=lambda result: result["row"])
+
                 self.statuses[batch_id] = "completed"
 
             except Exception as e:
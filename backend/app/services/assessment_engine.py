@@ -1,3 +1,4 @@
+import os
 from typing import Any, Dict
 
 from app.services.registry import get_assessment_config
@@ -26,10 +27,10 @@ class AssessmentEngine:
 
         config = get_assessment_config(assessment_type)
 
-        predict_fn = config["predict_fn"]
-        input_schema = config["input_schema"]
-        output_schema = config["output_schema"]
-        specialty = config["specialty"]
+        predict_fn = config.predict_fn
+        input_schema = config.input_schema
+        output_schema = config.output_schema
+        specialty = config.specialty
 
         # --------------------------------------------------
         # 2. Validate input
@@ -83,7 +84,12 @@ class AssessmentEngine:
         # 6. Upload PDF + update record
         # --------------------------------------------------
 
-        pdf_url = self.repo.upload_pdf(assessment_id, pdf_path)
+        try:
+            pdf_url = self.repo.upload_pdf(assessment_id, pdf_path)
+        finally:
+            # The stored copy is authoritative; drop the local file
+            # before the DB round-trip instead of leaving it in /tmp.
+            _remove_quietly(pdf_path)
 
         self.repo.update_pdf_url(assessment_id, pdf_url)
 
@@ -114,4 +120,11 @@ class AssessmentEngine:
         try:
             return dict(result)
         except Exception:
-            return {"result": result}
\ No newline at end of file
+            return {"result": result}
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
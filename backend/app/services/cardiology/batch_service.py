@@ -1,13 +1,15 @@
 # app/services/cardiology/cardio_batch_service.py
 
 from fastapi import BackgroundTasks, UploadFile
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from uuid import uuid4
 import csv
 import io
+import os
 
 from app.schemas.cardiology.cardiology import ASCVDInput, ASCVDRiskOutput
 from app.clinical.cardiology.ascvd import calculate_ascvd_risk
+from app.repositories.assessments_repository import AssessmentsRepository
 
 from supabase import create_client, Client
 
@@ -19,8 +21,6 @@ def get_supabase_client():
     Returns a Supabase client if credentials exist in the environment.
     Raises RuntimeError if not set.
     """
-    from supabase import create_client, Client
-
     SUPABASE_URL = os.environ.get("SUPABASE_URL")
     SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
 
@@ -57,9 +57,11 @@ class CardioBatchService:
 
         async def background_job():
             try:
+                supabase = get_supabase_client()
                 file_bytes = await file.read()
                 rows = self._parse_csv(file_bytes)
                 results: List[Dict[str, Any]] = []
+                pending: List[Tuple[int, Dict[str, Any]]] = []
 
                 for index, row in enumerate(rows):
                     try:
@@ -81,13 +83,23 @@ class CardioBatchService:
                             "result": output_data.model_dump() if hasattr(output_data, "model_dump") else dict(output_data),
                         }
 
-                        # Insert into Supabase
-                        supabase.table(supabase_table).insert(record).execute()
-
-                        results.append({"row": index + 1, "status": "completed"})
+                        pending.append((index + 1, record))
                     except Exception as row_err:
                         results.append({"row": index + 1, "status": "failed", "error": str(row_err)})
 
+                repository = AssessmentsRepository(supabase, supabase_table)
+                insert_errors = repository.create_many_isolated(
+                    [record for _, record in pending]
+                )
+                for (row_number, _), error in zip(pending, insert_errors, strict=True):
+                    if error is None:
+                        results.append({"row": row_number, "status": "completed"})
+                    else:
+                        results.append(
+                            {"row": row_number, "status": "failed", "error": error}
+                        )
+                results.sort(key=lambda result: result["row"])
+
                 self.statuses[batch_id] = "completed"
 
             except Exception as e:
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Tests import the service as ``app.*``, like the Dockerfile layout.
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
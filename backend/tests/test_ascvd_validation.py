@@ -0,0 +1,51 @@
+import math
+
+import pytest
+
+from app.clinical.cardiology.ascvd import _validate_input
+
+VALID = {
+    "age": 55,
+    "gender": "male",
+    "race": "white",
+    "total_cholesterol": 200,
+    "hdl_cholesterol": 50,
+    "systolic_bp": 120,
+}
+
+
+def test_valid_input_returns_lowered_gender_and_race():
+    data = {**VALID, "gender": "Female", "race": "BLACK"}
+
+    assert _validate_input(data) == ("female", "black")
+
+
+@pytest.mark.parametrize(
+    ("field", "message"),
+    [
+        ("age", "Age"),
+        ("total_cholesterol", "Total cholesterol"),
+        ("hdl_cholesterol", "HDL cholesterol"),
+        ("systolic_bp", "Systolic BP"),
+    ],
+)
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_values_are_rejected(field, message, value):
+    with pytest.raises(ValueError, match=message):
+        _validate_input({**VALID, field: value})
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"age": 90, "gender": "unknown"}, "Age"),
+        ({"age": math.nan, "race": "unknown"}, "Age"),
+        ({"gender": "unknown", "total_cholesterol": 400}, "Gender"),
+        ({"gender": "unknown", "race": "unknown"}, "Gender"),
+        ({"race": "unknown", "systolic_bp": math.nan}, "Race"),
+        ({"hdl_cholesterol": 10, "systolic_bp": 300}, "HDL cholesterol"),
+    ],
+)
+def test_mixed_invalid_input_reports_fields_in_original_order(overrides, message):
+    with pytest.raises(ValueError, match=message):
+        _validate_input({**VALID, **overrides})
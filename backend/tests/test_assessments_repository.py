@@ -0,0 +1,157 @@
+import importlib
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+
+def _stub_module(name, **attrs):
+    """Stand in for an SDK module the repository imports, if it's missing."""
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        module = ModuleType(name)
+        module.__dict__.update(attrs)
+        sys.modules[name] = module
+
+
+# The repository only ever talks to the client passed in (FakeClient below);
+# the SDK imports just need to resolve.
+_stub_module("httpx", HTTPError=type("HTTPError", (Exception,), {}))
+_stub_module("postgrest")
+_stub_module("postgrest.exceptions", APIError=type("APIError", (Exception,), {}))
+_stub_module("supabase", Client=object)
+
+from app.repositories.assessments_repository import (
+    SUMMARY_COLUMNS,
+    AssessmentsRepository,
+)
+
+
+class FakeQuery:
+    """Records the PostgREST builder calls made on one table."""
+
+    def __init__(self, client, table_name):
+        self.client = client
+        self.table_name = table_name
+        self.calls = []
+        client.queries.append(self)
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return record
+
+    def execute(self):
+        return self.client.respond(self)
+
+
+class FakeClient:
+    def __init__(self, respond=None):
+        self.queries = []
+        self.respond = respond or (lambda query: SimpleNamespace(data=[]))
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+def _call(query, name):
+    return [call for call in query.calls if call[0] == name]
+
+
+def test_get_by_clinician_selects_full_rows_by_default():
+    client = FakeClient()
+    AssessmentsRepository(client).get_by_clinician("c1")
+
+    (query,) = client.queries
+    assert _call(query, "select") == [("select", ("*",), {})]
+    assert _call(query, "or_") == []
+    assert _call(query, "limit") == []
+
+
+def test_get_by_clinician_summary_only_projects_columns():
+    client = FakeClient()
+    AssessmentsRepository(client).get_by_clinician("c1", summary_only=True)
+
+    (query,) = client.queries
+    assert _call(query, "select") == [("select", (SUMMARY_COLUMNS,), {})]
+    assert "result" not in SUMMARY_COLUMNS.split(",")
+
+
+LAST_ID = "3f2504e0-4f89-41d3-9a0c-0305e82c3301"
+
+
+def test_get_by_clinician_keyset_cursor():
+    client = FakeClient()
+    AssessmentsRepository(client).get_by_clinician(
+        "c1",
+        limit=50,
+        cursor=("2024-01-01T00:00:00+00:00", LAST_ID.upper()),
+    )
+
+    (query,) = client.queries
+    (or_call,) = _call(query, "or_")
+    assert or_call[1][0] == (
+        'created_at.lt."2024-01-01T00:00:00+00:00",'
+        f'and(created_at.eq."2024-01-01T00:00:00+00:00",id.lt."{LAST_ID}")'
+    )
+    assert _call(query, "order") == [
+        ("order", ("created_at",), {"desc": True}),
+        ("order", ("id",), {"desc": True}),
+    ]
+    assert _call(query, "limit") == [("limit", (50,), {})]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        ('2024-01-01",id.gt."0', LAST_ID),
+        ("2024-01-01T00:00:00+00:00", 'x"),id.neq.("'),
+        ("2024-01-01T00:00:00+00:00", "abc"),
+        ("yesterday", LAST_ID),
+    ],
+)
+def test_get_by_clinician_rejects_malformed_cursor(cursor):
+    client = FakeClient()
+
+    with pytest.raises(ValueError, match="Invalid assessments cursor"):
+        AssessmentsRepository(client).get_by_clinician("c1", cursor=cursor)
+
+    assert not any(_call(query, "or_") for query in client.queries)
+
+
+def test_create_many_pages_inserts():
+    def respond(query):
+        (insert,) = _call(query, "insert")
+        return SimpleNamespace(data=list(insert[1][0]))
+
+    client = FakeClient(respond)
+    records = [{"n": i} for i in range(5)]
+
+    created = AssessmentsRepository(client).create_many(records, page_size=2)
+
+    assert created == records
+    assert [len(_call(q, "insert")[0][1][0]) for q in client.queries] == [2, 2, 1]
+
+
+def test_create_many_isolated_retries_failed_page_row_by_row():
+    def respond(query):
+        (insert,) = _call(query, "insert")
+        rows = insert[1][0]
+        rows = rows if isinstance(rows, list) else [rows]
+        if any(row.get("bad") for row in rows):
+            return SimpleNamespace(error="boom", data=None)
+        return SimpleNamespace(data=rows)
+
+    client = FakeClient(respond)
+    records = [{"n": 0}, {"n": 1, "bad": True}, {"n": 2}, {"n": 3}]
+
+    errors = AssessmentsRepository(client).create_many_isolated(records, page_size=2)
+
+    assert errors == [None, "boom", None, None]
+    # only the failed first page is retried row by row; the second page
+    # goes out once, as a page, and none of its rows are re-sent
+    inserts = [_call(q, "insert")[0][1][0] for q in client.queries]
+    assert inserts == [records[0:2], records[0], records[1], records[2:4]]
@@ -0,0 +1,194 @@
+"""
+Batch APIs must agree with their scalar counterparts, row for row.
+
+Scalar inputs are SimpleNamespace objects rather than the Pydantic
+schemas so out-of-range rows reach the calculators' own validation.
+"""
+
+import itertools
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.clinical.cardiology import ascvd
+from app.clinical.cardiology.bp_category import (
+    _CATEGORY_NAMES,
+    categorize_blood_pressure,
+    classify_bp_batch,
+)
+from app.clinical.cardiology.cha2ds2vasc import (
+    _RISK_CATEGORIES,
+    calculate_cha2ds2vasc,
+    score_batch,
+)
+from app.clinical.cardiology.ecg_interpret import (
+    interpret_ecg,
+    interpret_ecg_batch,
+)
+
+
+def _grid(**axes):
+    keys = list(axes)
+    return [dict(zip(keys, values)) for values in itertools.product(*axes.values())]
+
+
+# ==========================================================
+# ASCVD
+# ==========================================================
+def _scalar_ascvd(row: dict) -> float:
+    try:
+        gender, race = ascvd._validate_input(row)
+    except ValueError:
+        return math.nan
+    cohort_race = "black" if race == "black" else "white"
+    terms = ascvd._build_feature_terms(row, gender, cohort_race)
+    return ascvd._compute_risk(ascvd._PCE_CONSTANTS[(gender, cohort_race)], terms)
+
+
+def test_predict_ascvd_batch_matches_scalar():
+    rows = _grid(
+        age=[39, 40, 62, 79, 80],
+        gender=["male", "Female", "unknown"],
+        race=["white", "Black", "asian", "martian"],
+        total_cholesterol=[129, 200, 320, math.nan],
+        hdl_cholesterol=[19, 50, 100],
+        systolic_bp=[90, 145, 201],
+        on_hypertension_treatment=[False, True],
+        smoker=[0, 1],
+        diabetes=[1],
+    )
+
+    batch = ascvd.predict_ascvd_batch(pd.DataFrame(rows))
+    expected = np.array([_scalar_ascvd(row) for row in rows])
+
+    assert np.isnan(expected).any() and not np.isnan(expected).all()
+    np.testing.assert_array_equal(np.isnan(batch), np.isnan(expected))
+    np.testing.assert_allclose(batch, expected, rtol=1e-9, equal_nan=True)
+
+
+# ==========================================================
+# Blood pressure category
+# ==========================================================
+def _reference_bp_category(systolic, diastolic):
+    """The original ACC/AHA comparison chain the lookup table replaced."""
+    if systolic >= 180 or diastolic >= 120:
+        return "hypertensive_crisis"
+    if systolic >= 140 or diastolic >= 90:
+        return "hypertension_stage_2"
+    if 130 <= systolic < 140 or 80 <= diastolic < 90:
+        return "hypertension_stage_1"
+    if 120 <= systolic < 130 and diastolic < 80:
+        return "elevated"
+    return "normal"
+
+
+BP_READINGS = [
+    -math.inf,
+    -5,
+    0,
+    79.9,
+    80,
+    89.5,
+    90,
+    119.9,
+    120,
+    129.99,
+    130,
+    139.6,
+    140,
+    179.9,
+    180,
+    300,
+    math.inf,
+    math.nan,
+]
+
+
+def test_classify_bp_batch_matches_scalar_and_comparison_chain():
+    pairs = list(itertools.product(BP_READINGS, BP_READINGS))
+    sbp, dbp = (np.array(column, dtype=np.float64) for column in zip(*pairs))
+
+    batch = [_CATEGORY_NAMES[code] for code in classify_bp_batch(sbp, dbp)]
+    scalar = [
+        categorize_blood_pressure(
+            SimpleNamespace(patient_id=None, systolic_bp=s, diastolic_bp=d)
+        ).category
+        for s, d in pairs
+    ]
+    expected = [_reference_bp_category(s, d) for s, d in pairs]
+
+    assert scalar == expected
+    assert batch == expected
+
+
+# ==========================================================
+# CHA₂DS₂-VASc
+# ==========================================================
+def test_score_batch_matches_scalar():
+    rows = _grid(
+        age=[18, 64, 65, 74, 75, 120],
+        gender=["male", "female"],
+        congestive_heart_failure=[False, True],
+        hypertension=[False, True],
+        diabetes=[False, True],
+        stroke_tia_thromboembolism=[False, True],
+        vascular_disease=[False, True],
+    )
+
+    def column(name):
+        return np.array([int(row[name]) for row in rows], dtype=np.int64)
+
+    scores, risk = score_batch(
+        column("age"),
+        np.array([int(row["gender"] == "female") for row in rows], dtype=np.int64),
+        column("congestive_heart_failure"),
+        column("hypertension"),
+        column("diabetes"),
+        column("vascular_disease"),
+        column("stroke_tia_thromboembolism"),
+    )
+
+    for row, score, code in zip(rows, scores, risk, strict=True):
+        out = calculate_cha2ds2vasc(SimpleNamespace(patient_id=None, **row))
+        assert (int(score), _RISK_CATEGORIES[code]) == (out.score, out.risk_category)
+
+
+def test_cha2ds2vasc_scalar_rejects_out_of_range_rows():
+    base = {
+        "patient_id": None,
+        "congestive_heart_failure": False,
+        "hypertension": False,
+        "diabetes": False,
+        "stroke_tia_thromboembolism": False,
+        "vascular_disease": False,
+    }
+    with pytest.raises(ValueError):
+        calculate_cha2ds2vasc(SimpleNamespace(age=-1, gender="male", **base))
+    with pytest.raises(ValueError):
+        calculate_cha2ds2vasc(SimpleNamespace(age=70, gender="other", **base))
+
+
+# ==========================================================
+# ECG interpretation
+# ==========================================================
+def test_interpret_ecg_batch_matches_scalar():
+    rows = _grid(
+        heart_rate=[19, 59, 80, 101, 301],
+        qrs_duration=[39, 100, 121, 201],
+        qt_interval=[None, 199, 400, 451],
+        pr_interval=[None, 79, 119, 160, 201],
+        rhythm=["sinus", "AFib", "flutter", "other", "junctional"],
+        st_elevation=[False, True],
+        t_wave_inversion=[False, True],
+    )
+
+    batch = interpret_ecg_batch(pd.DataFrame(rows))
+
+    for row, findings, overall_risk in zip(
+        rows, batch["findings"], batch["overall_risk"], strict=True
+    ):
+        out = interpret_ecg(SimpleNamespace(patient_id=None, **row))
+        assert (findings, overall_risk) == (out.findings, out.overall_risk), row
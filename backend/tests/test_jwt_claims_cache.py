@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("authlib")
+pytest.importorskip("httpx")
+
+from app.api import deps
+
+
+def _freeze_time(monkeypatch, now):
+    # Patch only deps' view of time, not the process-wide time module
+    monkeypatch.setattr(deps, "time", SimpleNamespace(time=lambda: now))
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(deps, "_CLAIMS_CACHE", type(deps._CLAIMS_CACHE)())
+    _freeze_time(monkeypatch, 1_000.0)
+
+
+def test_cached_claims_are_served_until_exp(monkeypatch):
+    deps._set_cached_claims("token", {"sub": "user-1", "exp": 1_060})
+
+    assert deps._get_cached_claims("token") == {"sub": "user-1", "exp": 1_060}
+
+    _freeze_time(monkeypatch, 1_060.0)
+    assert deps._get_cached_claims("token") is None
+    assert "token" not in deps._CLAIMS_CACHE
+
+
+def test_claims_without_numeric_exp_are_not_cached():
+    deps._set_cached_claims("no-exp", {"sub": "user-1"})
+    deps._set_cached_claims("str-exp", {"sub": "user-1", "exp": "1060"})
+
+    assert not deps._CLAIMS_CACHE
+
+
+def test_cached_claims_are_copies():
+    deps._set_cached_claims("token", {"sub": "user-1", "exp": 1_060})
+
+    deps._get_cached_claims("token")["sub"] = "someone-else"
+
+    assert deps._get_cached_claims("token")["sub"] == "user-1"
+
+
+def test_full_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(deps, "CLAIMS_CACHE_SIZE", 2)
+
+    deps._set_cached_claims("a", {"sub": "a", "exp": 1_060})
+    deps._set_cached_claims("b", {"sub": "b", "exp": 1_060})
+    deps._get_cached_claims("a")
+    deps._set_cached_claims("c", {"sub": "c", "exp": 1_060})
+
+    assert list(deps._CLAIMS_CACHE) == ["a", "c"]
+    assert deps._get_cached_claims("b") is None
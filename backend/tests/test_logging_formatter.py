@@ -0,0 +1,47 @@
+import json
+import logging
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("pythonjsonlogger")
+pytest.importorskip("orjson")
+
+from app.core.logging import SafeJsonFormatter
+
+
+def _format(**extra):
+    formatter = SafeJsonFormatter(
+        "%(asctime)s %(level)s %(logger)s %(message)s",
+        rename_fields={"asctime": "timestamp"},
+    )
+    record = logging.LogRecord(
+        "clinovia", logging.INFO, __file__, 1, "predicted", None, None
+    )
+    record.__dict__.update(extra)
+    return json.loads(formatter.format(record))
+
+
+def test_record_is_encoded_with_orjson():
+    prediction_id = UUID("3f2504e0-4f89-41d3-9a0c-0305e82c3301")
+    created = datetime(2024, 1, 1, tzinfo=UTC)
+
+    line = _format(prediction_id=prediction_id, created_at=created, counts={1: 2})
+
+    assert line["message"] == "predicted"
+    assert line["level"] == "INFO"
+    assert line["logger"] == "clinovia"
+    assert "timestamp" in line
+    assert line["prediction_id"] == str(prediction_id)
+    assert line["created_at"] == "2024-01-01T00:00:00+00:00"
+    assert line["counts"] == {"1": 2}
+
+
+class Unencodable:
+    def __str__(self):
+        return "unencodable"
+
+
+def test_unencodable_values_fall_back_to_str():
+    assert _format(model=Unencodable())["model"] == "unencodable"
@@ -0,0 +1,37 @@
+import pytest
+
+from app.clinical.cardiology import ascvd, bp_category, cha2ds2vasc, ecg_interpret
+from app.services.registry import (
+    ASSESSMENT_REGISTRY,
+    get_assessment_config,
+    register_assessment,
+)
+
+
+@pytest.mark.parametrize(
+    ("assessment_type", "predict_fn"),
+    [
+        ("CARDIOLOGY_ASCVD", ascvd.calculate_ascvd),
+        ("CARDIOLOGY_BP", bp_category.categorize_blood_pressure),
+        ("CARDIOLOGY_CHA2DS2VASC", cha2ds2vasc.calculate_cha2ds2vasc),
+        ("CARDIOLOGY_ECG", ecg_interpret.interpret_ecg),
+    ],
+)
+def test_cardiology_scorers_register_on_import(assessment_type, predict_fn):
+    config = get_assessment_config(assessment_type)
+
+    assert config.specialty == "cardiology"
+    assert config.predict_fn is predict_fn
+
+
+def test_duplicate_registration_is_rejected():
+    config = ASSESSMENT_REGISTRY["CARDIOLOGY_BP"]
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_assessment(
+            assessment_type="CARDIOLOGY_BP",
+            specialty=config.specialty,
+            predict_fn=config.predict_fn,
+            input_schema=config.input_schema,
+            output_schema=config.output_schema,
+        )
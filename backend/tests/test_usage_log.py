@@ -0,0 +1,44 @@
+import logging
+
+import pytest
+from pydantic import BaseModel
+
+from app.clinical import utils
+
+
+class Output(BaseModel):
+    findings: list
+
+
+class RecordingQueue(list):
+    put = list.append
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    records = RecordingQueue()
+    monkeypatch.setattr(utils, "_LOG_Q", records)
+    monkeypatch.setattr(utils, "USAGE_LOG_ENABLED", True)
+    level = utils.logger.level
+    utils.logger.setLevel(logging.INFO)
+    yield records
+    utils.logger.setLevel(level)
+
+
+def test_pydantic_metadata_is_snapshotted_on_enqueue(queued):
+    output = Output(findings=["normal"])
+
+    utils.log_usage("interpret_ecg", metadata={"output": output})
+    output.findings.append("afib")
+
+    [(name, metadata, _)] = queued
+    assert name == "interpret_ecg"
+    assert metadata == {"output": {"findings": ["normal"]}}
+
+
+def test_nothing_is_queued_when_info_is_disabled(queued):
+    utils.logger.setLevel(logging.WARNING)
+
+    utils.log_usage("interpret_ecg", metadata={"output": Output(findings=[])})
+
+    assert not queued
@@ -0,0 +1,79 @@
+"""
+Export fitted scalers to memory-mappable .npy files
+---------------------------------------------------
+Offline helper (not imported by the API). For every ``*_scaler.pkl``
+under MODEL_ROOT that is a StandardScaler, writes a ``.npy`` sibling
+holding a (2, n_features) float64 array — ``mean_`` then ``scale_`` —
+which ``app.clinical.utils.load_model`` maps read-only in place of
+the pickle, plus a ``.features.npy`` with ``feature_names_in_``.
+
+Usage (from backend/):
+    python -m tools.convert_scalers_to_npy
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+from app.clinical.utils import MODEL_ROOT, _load_scaler_mmap
+
+logger = logging.getLogger(__name__)
+
+# What joblib.load raises for unreadable or environment-incompatible pickles
+LOAD_ERRORS = (OSError, EOFError, ImportError, AttributeError, pickle.UnpicklingError)
+
+
+def convert(scaler_path: Path) -> Path | None:
+    try:
+        scaler = joblib.load(scaler_path)
+    except LOAD_ERRORS as exc:
+        logger.warning("Skipping %s (load failed: %s)", scaler_path.name, exc)
+        return None
+
+    if type(scaler).__name__ != "StandardScaler":
+        logger.info("Skipping %s (%s)", scaler_path.name, type(scaler).__name__)
+        return None
+
+    n_features = scaler.n_features_in_
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+    scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+    params = np.vstack([mean, scale]).astype(np.float64)
+
+    npy_path = scaler_path.with_suffix(".npy")
+    np.save(npy_path, params, allow_pickle=False)
+
+    names = getattr(scaler, "feature_names_in_", None)
+    if names is not None:
+        names_path = npy_path.with_suffix(".features.npy")
+        np.save(names_path, np.asarray(names, dtype=str), allow_pickle=False)
+
+    _check_parity(scaler, npy_path)
+    return npy_path
+
+
+def _check_parity(scaler, npy_path: Path, n_rows: int = 256) -> None:
+    """Compare the mapped scaler's transform against sklearn."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_rows, scaler.n_features_in_))
+
+    expected = scaler.transform(X)
+    actual = _load_scaler_mmap(npy_path).transform(X)
+    logger.info("  max |dx| = %.2e", float(np.max(np.abs(expected - actual))))
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    for scaler_path in sorted(MODEL_ROOT.rglob("*_scaler.pkl")):
+        logger.info("Converting %s", scaler_path.relative_to(MODEL_ROOT))
+        out = convert(scaler_path)
+        if out:
+            logger.info("Wrote %s", out.relative_to(MODEL_ROOT))
+
+
+if __name__ == "__main__":
+    main()